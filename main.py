@@ -3,6 +3,15 @@ import os
 import psutil
 import time
 import logging
+import logging.handlers
+import queue
+import atexit
+import functools
+import errno
+import select
+import signal
+import socket
+import struct
 from datetime import datetime, timedelta
 import threading
 
@@ -10,11 +19,16 @@ from PyQt5 import QtWidgets, QtGui, QtCore
 from plyer import notification
 
 # Setup Logging
-logging.basicConfig(
-    filename='app_blocker.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Records are queued by the calling thread and written to disk by a listener thread,
+# so a burst of kills in BlockerThread never waits on file I/O.
+log_file_handler = logging.FileHandler('app_blocker.log')
+log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, log_file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on exit
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logging.getLogger().setLevel(logging.INFO)
 
 # Check for Administrative Privileges
 def is_admin():
@@ -45,6 +59,147 @@ def request_admin():
                                        "This application requires administrative privileges. Please run it as root.")
         sys.exit(1)
 
+# Linux Process Events Connector (see linux/connector.h and linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+NLMSG_DONE = 3
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_EXEC = 0x00000002
+NLMSG_HEADER = struct.Struct("=IHHII")     # len, type, flags, seq, pid
+CN_MSG_HEADER = struct.Struct("=IIIIHH")   # idx, val, seq, ack, len, flags
+PROC_EVENT_HEADER = struct.Struct("=IIQ")  # what, cpu, timestamp_ns
+EXEC_EVENT = struct.Struct("=II")          # process_pid, process_tgid
+
+def open_proc_connector():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+    except (OSError, AttributeError) as e:
+        logging.warning(f"Process events connector unavailable: {e}")
+        return None
+    try:
+        sock.bind((0, CN_IDX_PROC))
+        op = struct.pack("=I", PROC_CN_MCAST_LISTEN)
+        cn_msg = CN_MSG_HEADER.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(op), 0) + op
+        header = NLMSG_HEADER.pack(NLMSG_HEADER.size + len(cn_msg), NLMSG_DONE, 0, 0, sock.getsockname()[0])
+        sock.sendto(header + cn_msg, (0, 0))
+    except OSError as e:
+        logging.warning(f"Process events connector unavailable: {e}")
+        sock.close()
+        return None
+    return sock
+
+def read_exec_pids(sock):
+    data = sock.recv(65536)
+    pids = []
+    offset = 0
+    while offset + NLMSG_HEADER.size <= len(data):
+        msg_len = NLMSG_HEADER.unpack_from(data, offset)[0]
+        if msg_len < NLMSG_HEADER.size:
+            break
+        event_offset = offset + NLMSG_HEADER.size + CN_MSG_HEADER.size
+        try:
+            what = PROC_EVENT_HEADER.unpack_from(data, event_offset)[0]
+            if what == PROC_EVENT_EXEC:
+                _, tgid = EXEC_EVENT.unpack_from(data, event_offset + PROC_EVENT_HEADER.size)
+                pids.append(tgid)
+        except struct.error:
+            break
+        offset += (msg_len + 3) & ~3
+    return pids
+
+# Process Identity from /proc
+def read_proc_identity(pid, want_exe=True, proc_fd=None):
+    # Relative to proc_fd when given, so the kernel doesn't re-resolve /proc for every file
+    base = f"{pid}/" if proc_fd is not None else f"/proc/{pid}/"
+    try:
+        fd = os.open(base + "comm", os.O_RDONLY, dir_fd=proc_fd)
+        try:
+            name = os.read(fd, 256).decode(errors='replace').rstrip('\n')
+        finally:
+            os.close(fd)
+    except OSError:
+        return None, None
+    if len(name) >= 15:
+        # comm is truncated to 15 characters; recover the full name from the command line
+        try:
+            fd = os.open(base + "cmdline", os.O_RDONLY, dir_fd=proc_fd)
+            try:
+                cmdline = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            argv0 = os.path.basename(cmdline.split(b'\0', 1)[0].decode(errors='replace'))
+            if argv0.startswith(name):
+                name = argv0
+        except OSError:
+            pass
+    if not want_exe:
+        return name, None
+    try:
+        exe = os.readlink(base + "exe", dir_fd=proc_fd)
+    except OSError:
+        return name, None
+    if exe.endswith(" (deleted)") and not os.path.exists(exe):
+        # The binary was replaced while running (e.g. after an update); match on its original path
+        exe = exe[:-len(" (deleted)")]
+    return name, exe
+
+# Windows Process Start Events (WMI)
+def open_wmi_watcher():
+    if os.name != 'nt':
+        return None
+    try:
+        import pythoncom
+        import wmi
+    except ImportError:
+        return None
+    try:
+        pythoncom.CoInitialize()
+    except Exception as e:
+        logging.warning(f"WMI process start trace unavailable: {e}")
+        return None
+    try:
+        return wmi.WMI().Win32_ProcessStartTrace.watch_for()
+    except Exception as e:
+        logging.warning(f"WMI process start trace unavailable: {e}")
+        pythoncom.CoUninitialize()
+        return None
+
+# Path Normalisation (case-insensitive on Windows)
+def normalize_path(path):
+    return os.path.normcase(os.path.abspath(path))
+
+# Windows Process Termination
+PROCESS_TERMINATE = 0x0001
+SYNCHRONIZE = 0x00100000  # Required for WaitForSingleObject on the handle
+WAIT_TIMEOUT = 0x00000102
+WAIT_FAILED = 0xFFFFFFFF
+ERROR_INVALID_PARAMETER = 87  # OpenProcess on a pid that no longer exists
+
+@functools.lru_cache(maxsize=None)
+def load_kernel32():
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    kernel32.TerminateProcess.restype = wintypes.BOOL
+    kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    return kernel32
+
+# Application Icon
+ICON_PATH = "app_icon.png"  # Optional: Add an icon file
+
+@functools.lru_cache(maxsize=None)
+def app_icon():
+    return QtGui.QIcon(ICON_PATH) if os.path.exists(ICON_PATH) else None
+
 # Notification Function
 def send_notification(title, message):
     try:
@@ -57,98 +212,345 @@ def send_notification(title, message):
     except Exception as e:
         logging.error(f"Failed to send notification: {e}")
 
+# Minimum time between update_stats emits from the blocking loop
+STATS_EMIT_INTERVAL_NS = 250_000_000
+
+# While watching process events, still run a full scan every this many check_frequency ticks
+EVENT_RESCAN_TICKS = 5
+
+# Longest single WMI event wait in seconds; bounds how long stop() can block on Windows
+WMI_WAIT_SLICE = 0.25
+
 # Worker Thread for Blocking Applications
 class BlockerThread(QtCore.QThread):
     update_stats = QtCore.pyqtSignal(int, int, int)  # time_remaining, blocked_apps, attempts
 
     def __init__(self, app_paths=None, process_names=None, duration_minutes=30, start_time=None, notify=False, check_frequency=1):
         super().__init__()
-        self.app_paths = [os.path.abspath(path) for path in app_paths] if app_paths else []
-        self.process_names = [pn.lower() for pn in process_names] if process_names else []
+        # The GUI normalises paths as they are added (see normalize_path) and lower-cases names
+        self.app_paths = frozenset(app_paths or [])
+        self.process_names = frozenset(process_names or [])
         self.duration_minutes = duration_minutes
-        self.start_time = start_time
+        # Parse HH:MM up front so a bad value is reported to the caller, not mid-thread
+        self.start_time = datetime.strptime(start_time, "%H:%M").time() if start_time else None
         self.notify = notify
         self.check_frequency = check_frequency
-        self.running = True
+        self._stop = threading.Event()
+        self._wake_w = None  # Set by run() while it polls process events
+        self.scheduled_start_epoch = None  # Read by the GUI countdown timer
         self.attempts = 0
+        self._last_emit_ns = 0
+        self._kernel32 = load_kernel32() if os.name == 'nt' else None
+        # /proc/<pid>/exe is already absolute, and POSIX paths need no case folding
+        self._exe_is_normalized = sys.platform == 'linux'
 
     def run(self):
         # Schedule Start Time if Provided
         if self.start_time:
-            try:
-                start_datetime = datetime.strptime(self.start_time, "%H:%M").replace(
-                    year=datetime.now().year,
-                    month=datetime.now().month,
-                    day=datetime.now().day
-                )
-                now = datetime.now()
-                if start_datetime < now:
-                    # If the start time has already passed today, schedule for tomorrow
-                    start_datetime += timedelta(days=1)
-                wait_seconds = (start_datetime - now).total_seconds()
-                logging.info(f"Scheduled to start blocking at {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-                if self.notify:
-                    send_notification("App Blocker", f"Blocking scheduled at {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-                # Countdown Timer
-                while wait_seconds > 0 and self.running:
-                    mins, secs = divmod(int(wait_seconds), 60)
-                    self.update_stats.emit(wait_seconds, 0, self.attempts)
-                    time.sleep(1)
-                    wait_seconds -= 1
-            except ValueError:
-                logging.error("Incorrect time format. Please use HH:MM (24-hour format).")
-                if self.notify:
-                    send_notification("App Blocker", "Incorrect time format. Use HH:MM (24-hour format).")
+            now = datetime.now()
+            start_datetime = datetime.combine(now.date(), self.start_time)
+            if start_datetime < now:
+                # If the start time has already passed today, schedule for tomorrow
+                start_datetime += timedelta(days=1)
+            wait_seconds = (start_datetime - now).total_seconds()
+            logging.info(f"Scheduled to start blocking at {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+            if self.notify:
+                send_notification("App Blocker", f"Blocking scheduled at {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+            # Sleep until the start time in a single wait; stop() wakes it early.
+            # The GUI drives the on-screen countdown from scheduled_start_epoch.
+            self.scheduled_start_epoch = start_datetime.timestamp()
+            if self._stop.wait(wait_seconds):
                 return
 
-        end_time = datetime.now() + timedelta(minutes=self.duration_minutes)
+        # Monotonic deadline: no allocation per tick and immune to wall-clock jumps
+        deadline_ns = time.monotonic_ns() + self.duration_minutes * 60 * 1_000_000_000
         logging.info(f"Started blocking applications for {self.duration_minutes} minutes.")
         if self.notify:
             send_notification("App Blocker", f"Started blocking applications for {self.duration_minutes} minutes.")
 
+        # Prefer kernel process start events over rescanning the process table every tick
+        proc_events = open_proc_connector()
+        wmi_watcher = None if proc_events else open_wmi_watcher()
+        watching = bool(proc_events or wmi_watcher)
+        com_initialized = wmi_watcher is not None  # open_wmi_watcher left COM initialised on this thread
+        if proc_events:
+            # stop() writes to wake_w so a poll() blocked on process events returns immediately
+            wake_r, wake_w = socket.socketpair()
+            wake_w.setblocking(False)
+            self._wake_w = wake_w
+            poller = select.poll()
+            poller.register(proc_events, select.POLLIN)
+            poller.register(wake_r, select.POLLIN)
+        if watching:
+            logging.info("Watching for new processes via process start events.")
+
         # Blocking Loop
-        while datetime.now() < end_time and self.running:
-            blocked_apps = 0
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    # Check by Path
-                    if self.app_paths and proc.exe():
-                        proc_path = os.path.abspath(proc.exe())
-                        if proc_path in self.app_paths:
-                            proc_name = proc.name()
-                            proc.terminate()
-                            proc.wait(timeout=3)
-                            logging.info(f"Terminated process {proc.pid} ({proc_name}).")
-                            blocked_apps += 1
-                            self.attempts += 1
-                            if self.notify:
-                                send_notification("App Blocker", f"Terminated {proc_name} (PID: {proc.pid}).")
-
-                    # Check by Process Name
-                    if self.process_names:
-                        proc_name_lower = proc.name().lower()
-                        if proc_name_lower in self.process_names:
-                            proc.terminate()
-                            proc.wait(timeout=3)
-                            logging.info(f"Terminated process {proc.pid} ({proc.name()}).")
-                            blocked_apps += 1
-                            self.attempts += 1
-                            if self.notify:
-                                send_notification("App Blocker", f"Terminated {proc.name()} (PID: {proc.pid}).")
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired) as e:
-                    logging.warning(f"Failed to terminate process {proc.pid}: {e}")
-            # Calculate Time Remaining
-            time_remaining = int((end_time - datetime.now()).total_seconds())
-            self.update_stats.emit(time_remaining, blocked_apps, self.attempts)
-            time.sleep(self.check_frequency)  # Adjustable Check Frequency
-
-        if self.running:
+        next_scan_ns = 0  # Scan straight away to catch processes that were already running
+        rescan_interval_ns = int(EVENT_RESCAN_TICKS * self.check_frequency * 1_000_000_000)
+        last_blocked_apps = None
+        try:
+            while not self._stop.is_set() and (now_ns := time.monotonic_ns()) < deadline_ns:
+                if not watching or now_ns >= next_scan_ns:
+                    # Poll when events are unavailable. While watching, still rescan periodically to
+                    # retry processes that survived SIGTERM and to recover from missed events.
+                    blocked_apps = self.scan_processes()
+                    next_scan_ns = time.monotonic_ns() + rescan_interval_ns
+                else:
+                    # Wait at most check_frequency so stats keep updating and stop() is honoured
+                    timeout = min(self.check_frequency, (min(deadline_ns, next_scan_ns) - now_ns) / 1_000_000_000)
+                    if proc_events:
+                        try:
+                            blocked_apps = self.wait_for_execs(proc_events, poller, timeout)
+                        except OSError as e:
+                            # The event socket is unusable; fall back to polling for the rest of the session
+                            logging.warning(f"Process events connector failed, polling instead: {e}")
+                            proc_events.close()
+                            proc_events = None
+                            watching = False
+                            blocked_apps = 0
+                    else:
+                        try:
+                            # WMI waits can't be interrupted, so keep them short for stop()
+                            blocked_apps = self.wait_for_wmi_starts(wmi_watcher, min(timeout, WMI_WAIT_SLICE))
+                        except Exception as e:
+                            # x_wmi / com_error, e.g. after the WMI service restarts; poll instead
+                            logging.warning(f"WMI process start trace failed, polling instead: {e}")
+                            wmi_watcher = None
+                            watching = False
+                            blocked_apps = 0
+                # Calculate Time Remaining
+                now_ns = time.monotonic_ns()
+                time_remaining = max(deadline_ns - now_ns, 0) // 1_000_000_000
+                # Coalesce emits so a burst of process events doesn't flood the UI thread
+                if blocked_apps != last_blocked_apps or now_ns - self._last_emit_ns >= STATS_EMIT_INTERVAL_NS:
+                    self.update_stats.emit(time_remaining, blocked_apps, self.attempts)
+                    self._last_emit_ns = now_ns
+                    last_blocked_apps = blocked_apps
+                if not watching:
+                    if self._stop.wait(self.check_frequency):  # Adjustable Check Frequency
+                        break
+        finally:
+            if self._wake_w:
+                self._wake_w = None
+                wake_r.close()
+                wake_w.close()
+            if proc_events:
+                proc_events.close()
+            if com_initialized:
+                import pythoncom
+                pythoncom.CoUninitialize()
+
+        if not self._stop.is_set():
             logging.info("Finished blocking applications.")
             if self.notify:
                 send_notification("App Blocker", "Finished blocking applications.")
 
+    def scan_processes(self):
+        killed_this_tick = []
+        self._scan_into(killed_this_tick)
+        self.notify_terminated(killed_this_tick)
+        return len(killed_this_tick)
+
+    def _scan_into(self, killed):
+        # Only resolve executable paths when there are paths to match against
+        for pid, name, exe in self._iter_procs(want_exe=bool(self.app_paths)):
+            if self._is_blocked(name, exe):
+                self._terminate_and_record(pid, name, killed)
+
+    def _iter_procs(self, want_exe=True):
+        if sys.platform == 'linux':
+            yield from self._iter_procs_linux(want_exe)
+            return
+        attrs = ['pid', 'name', 'exe'] if want_exe else ['pid', 'name']
+        for proc in psutil.process_iter(attrs):
+            # Use the values process_iter already fetched rather than re-reading them
+            info = proc.info
+            yield info['pid'], info['name'] or '', info.get('exe')
+
+    def _iter_procs_linux(self, want_exe=True):
+        proc_fd = os.open('/proc', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(proc_fd) as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    pid = int(entry.name)
+                    name, exe = read_proc_identity(pid, want_exe, proc_fd)
+                    if name is not None:
+                        yield pid, name, exe
+        finally:
+            os.close(proc_fd)
+
+    def _terminate(self, pid):
+        if self._kernel32:
+            self._terminate_windows(pid, 3)
+            return
+        os.kill(pid, signal.SIGTERM)
+        self._wait_pid(pid, 3)
+
+    def _terminate_windows(self, pid, timeout):
+        import ctypes
+        handle = self._kernel32.OpenProcess(PROCESS_TERMINATE | SYNCHRONIZE, False, pid)
+        if not handle:
+            error = ctypes.get_last_error()
+            if error == ERROR_INVALID_PARAMETER:
+                raise ProcessLookupError(f"No process with PID {pid}")
+            raise ctypes.WinError(error)
+        try:
+            if not self._kernel32.TerminateProcess(handle, 1):
+                raise ctypes.WinError(ctypes.get_last_error())
+            result = self._kernel32.WaitForSingleObject(handle, int(timeout * 1000))
+            if result == WAIT_FAILED:
+                raise ctypes.WinError(ctypes.get_last_error())
+            if result == WAIT_TIMEOUT:
+                raise psutil.TimeoutExpired(timeout, pid=pid)
+        finally:
+            self._kernel32.CloseHandle(handle)
+
+    def wait_for_execs(self, sock, poller, timeout):
+        killed_this_tick = []
+        ready = poller.poll(timeout * 1000)
+        while ready and not self._stop.is_set():
+            try:
+                pids = read_exec_pids(sock)
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                # The receive buffer overflowed (exec burst) and events were dropped: resync
+                logging.warning("Process events were dropped; rescanning all processes.")
+                self._scan_into(killed_this_tick)
+                break
+            for pid in pids:
+                name, exe = read_proc_identity(pid, want_exe=bool(self.app_paths))
+                if name is not None and self._is_blocked(name, exe):
+                    self._terminate_and_record(pid, name, killed_this_tick)
+            # Drain any events that queued up while we were handling these
+            ready = poller.poll(0)
+        self.notify_terminated(killed_this_tick)
+        return len(killed_this_tick)
+
+    def wait_for_wmi_starts(self, watcher, timeout):
+        import wmi
+        try:
+            event = watcher(timeout_ms=int(timeout * 1000))
+        except wmi.x_wmi_timed_out:
+            return 0
+        pid = event.ProcessID
+        exe = None
+        if self.app_paths:
+            try:
+                exe = psutil.Process(pid).exe()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        killed = []
+        if self._is_blocked(event.ProcessName, exe):
+            self._terminate_and_record(pid, event.ProcessName, killed)
+        self.notify_terminated(killed)
+        return len(killed)
+
+    def _is_zombie(self, pid):
+        # A pidfd is readable as soon as the process is a zombie, so _wait_pid can't tell
+        # "killed now" from "exited long ago"; check the state before signalling instead
+        if os.name == 'nt':
+            return False
+        if sys.platform == 'linux':
+            try:
+                fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+                try:
+                    stat = os.read(fd, 512)
+                finally:
+                    os.close(fd)
+            except OSError:
+                return True  # Gone entirely
+            # The state follows the parenthesised command name, which may itself contain ')'
+            state_at = stat.rfind(b')') + 2
+            return stat[state_at:state_at + 1] == b'Z'
+        try:
+            return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            return True
+        except psutil.AccessDenied:
+            return False
+
+    def _wait_pid(self, pid, timeout):
+        # Blocks in the kernel until pid exits; raises psutil.TimeoutExpired like proc.wait did
+        try:
+            if hasattr(os, 'pidfd_open'):
+                # Linux >= 5.3: the pidfd becomes readable when the process exits
+                fd = os.pidfd_open(pid)
+                try:
+                    poller = select.poll()
+                    poller.register(fd, select.POLLIN)
+                    ready = poller.poll(timeout * 1000)
+                finally:
+                    os.close(fd)
+            elif hasattr(select, 'kqueue'):
+                # macOS/BSD: wait for NOTE_EXIT on the pid
+                kq = select.kqueue()
+                try:
+                    event = select.kevent(pid, filter=select.KQ_FILTER_PROC,
+                                          flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                                          fflags=select.KQ_NOTE_EXIT)
+                    ready = kq.control([event], 1, timeout)
+                finally:
+                    kq.close()
+            else:
+                raise AttributeError("pidfd_open and kqueue are unavailable")
+        except ProcessLookupError:
+            return  # Already exited
+        except (OSError, AttributeError):
+            # Old kernels or other platforms: fall back to psutil's polling wait
+            try:
+                psutil.Process(pid).wait(timeout=timeout)
+            except psutil.NoSuchProcess:
+                pass  # Already exited
+            return
+        if not ready:
+            raise psutil.TimeoutExpired(timeout, pid=pid)
+
+    def _is_blocked(self, name, exe):
+        # Check by Process Name first (a single set probe), then by Path
+        if self.process_names and name.lower() in self.process_names:
+            return True
+        # A missing exe (kernel threads, access denied) only rules out the path check
+        if not (self.app_paths and exe):
+            return False
+        return (exe if self._exe_is_normalized else normalize_path(exe)) in self.app_paths
+
+    def _terminate_and_record(self, pid, name, killed):
+        if self._is_zombie(pid):
+            return  # Already exited, just not reaped yet; it isn't ours to count
+        try:
+            self._terminate(pid)
+        except (ProcessLookupError, psutil.NoSuchProcess):
+            return  # Exited on its own before we got to it; nothing to report
+        except (OSError, psutil.AccessDenied, psutil.TimeoutExpired) as e:
+            logging.warning(f"Failed to terminate process {pid}: {e}")
+            return
+        logging.info(f"Terminated process {pid} ({name}).")
+        killed.append((pid, name))
+        self.attempts += 1
+
+    def notify_terminated(self, killed):
+        if not (self.notify and killed):
+            return
+        if len(killed) == 1:
+            pid, name = killed[0]
+            send_notification("App Blocker", f"Terminated {name} (PID: {pid}).")
+            return
+        names = ", ".join(name for _, name in killed[:5])
+        if len(killed) > 5:
+            names += f" and {len(killed) - 5} more"
+        send_notification("App Blocker", f"Terminated {len(killed)} processes: {names}.")
+
     def stop(self):
-        self.running = False
+        self._stop.set()
+        wake_w = self._wake_w
+        if wake_w:
+            try:
+                wake_w.send(b'\0')
+            except OSError:
+                pass  # Already closed, or a wakeup is already pending
         self.wait()
 
 # Main Application Window
@@ -156,7 +558,8 @@ class AppBlockerGUI(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("App Blocker")
-        self.setWindowIcon(QtGui.QIcon("app_icon.png"))  # Optional: Add an icon file
+        if app_icon():
+            self.setWindowIcon(app_icon())
         self.setMinimumSize(500, 400)
 
         # Initialize Variables
@@ -164,6 +567,7 @@ class AppBlockerGUI(QtWidgets.QWidget):
         self.time_remaining = 0
         self.blocked_apps = 0
         self.attempts = 0
+        self._last_stats = None
 
         # Layouts
         main_layout = QtWidgets.QVBoxLayout()
@@ -197,6 +601,8 @@ class AppBlockerGUI(QtWidgets.QWidget):
 
         self.names_input = QtWidgets.QLineEdit()
         self.names_input.setPlaceholderText("Enter process names separated by semicolons (;), e.g., notepad.exe;calculator.exe")
+        self.names_input.editingFinished.connect(self._parse_names)
+        self._process_names_cache = frozenset()
         process_names_layout.addWidget(self.names_input)
 
         main_layout.addLayout(process_names_layout)
@@ -270,11 +676,15 @@ class AppBlockerGUI(QtWidgets.QWidget):
         # Set Layout
         self.setLayout(main_layout)
 
+        # Schedule Countdown Timer
+        self.countdown_timer = QtCore.QTimer(self)
+        self.countdown_timer.setInterval(1000)
+        self.countdown_timer.timeout.connect(self.update_countdown)
+
         # System Tray
         self.tray_icon = QtWidgets.QSystemTrayIcon(self)
-        tray_icon_path = "app_icon.png"  # Optional: Add an icon file
-        if os.path.exists(tray_icon_path):
-            self.tray_icon.setIcon(QtGui.QIcon(tray_icon_path))
+        if app_icon():
+            self.tray_icon.setIcon(app_icon())
         else:
             self.tray_icon.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon))
         tray_menu = QtWidgets.QMenu()
@@ -305,9 +715,17 @@ class AppBlockerGUI(QtWidgets.QWidget):
         )
         if file_paths:
             for path in file_paths:
+                path = normalize_path(path)
                 if not self.app_paths_list.findItems(path, QtCore.Qt.MatchExactly):
                     self.app_paths_list.addItem(path)
 
+    def _parse_names(self):
+        # Parse once per edit rather than on every start; the set also drops duplicates
+        self._process_names_cache = frozenset(
+            name.strip().lower() for name in self.names_input.text().split(';') if name.strip()
+        )
+        self.names_input.setModified(False)
+
     def remove_application(self):
         selected_items = self.app_paths_list.selectedItems()
         if not selected_items:
@@ -318,7 +736,10 @@ class AppBlockerGUI(QtWidgets.QWidget):
     def start_blocking(self):
         # Gather Inputs
         app_paths = [self.app_paths_list.item(i).text() for i in range(self.app_paths_list.count())]
-        process_names = [name.strip() for name in self.names_input.text().split(';') if name.strip()]
+        if self.names_input.isModified():
+            # editingFinished may not have fired yet (e.g. buttons that don't take focus)
+            self._parse_names()
+        process_names = self._process_names_cache
         duration = self.duration_input.value()
         notify = self.notify_checkbox.isChecked()
         admin = self.admin_checkbox.isChecked()
@@ -336,6 +757,21 @@ class AppBlockerGUI(QtWidgets.QWidget):
         if admin and not is_admin():
             request_admin()
 
+        # Initialize Blocking Thread
+        try:
+            self.blocker_thread = BlockerThread(
+                app_paths=app_paths,
+                process_names=process_names,
+                duration_minutes=duration,
+                start_time=start_time,
+                notify=notify,
+                check_frequency=check_frequency
+            )
+        except ValueError:
+            logging.error("Incorrect time format. Please use HH:MM (24-hour format).")
+            QtWidgets.QMessageBox.warning(self, "Invalid Start Time", "Incorrect time format. Use HH:MM (24-hour format).")
+            return
+
         # Disable Inputs
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -349,18 +785,11 @@ class AppBlockerGUI(QtWidgets.QWidget):
         self.notify_checkbox.setEnabled(False)
         self.admin_checkbox.setEnabled(False)
 
-        # Initialize Blocking Thread
-        self.blocker_thread = BlockerThread(
-            app_paths=app_paths,
-            process_names=process_names,
-            duration_minutes=duration,
-            start_time=start_time,
-            notify=notify,
-            check_frequency=check_frequency
-        )
         self.blocker_thread.update_stats.connect(self.update_stats)
         self.blocker_thread.finished.connect(self.blocking_finished)
         self.blocker_thread.start()
+        if start_time:
+            self.countdown_timer.start()
 
     def stop_blocking(self):
         if self.blocker_thread and self.blocker_thread.isRunning():
@@ -371,46 +800,52 @@ class AppBlockerGUI(QtWidgets.QWidget):
                 send_notification("App Blocker", "Blocking session stopped by user.")
             QtWidgets.QMessageBox.information(self, "Blocked Stopped", "Blocking session has been stopped.")
 
-        # Reset Labels
-        self.time_label.setText("Time Remaining: N/A")
-        self.apps_label.setText("Blocked Applications: 0")
-        self.attempts_label.setText("Termination Attempts: 0")
-
-        # Enable Inputs
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.add_app_button.setEnabled(True)
-        self.remove_app_button.setEnabled(True)
-        self.names_input.setEnabled(True)
-        self.duration_input.setEnabled(True)
-        self.start_time_checkbox.setEnabled(True)
-        self.frequency_input.setEnabled(True)
-        self.notify_checkbox.setEnabled(True)
-        self.admin_checkbox.setEnabled(True)
+        self._reset_ui_to_idle()
 
     def update_stats(self, time_remaining, blocked_apps, attempts):
-        # Update Labels
-        if time_remaining > 0:
-            mins, secs = divmod(time_remaining, 60)
-            self.time_label.setText(f"Time Remaining: {mins}m {secs}s")
-        else:
-            self.time_label.setText("Time Remaining: 0m 0s")
+        # Skip the Qt relayout when nothing displayed has changed
+        stats = (max(time_remaining, 0), blocked_apps, attempts)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
 
+        # Update Labels
+        mins, secs = divmod(stats[0], 60)
+        time_str = f"{mins}m {secs}s"
+        self.time_label.setText(f"Time Remaining: {time_str}")
         self.apps_label.setText(f"Blocked Applications: {blocked_apps}")
         self.attempts_label.setText(f"Termination Attempts: {attempts}")
 
         # Update Tray Icon Tooltip
-        mins, secs = divmod(time_remaining, 60) if time_remaining > 0 else (0, 0)
         self.tray_icon.setToolTip(
-            f"App Blocker\nTime Remaining: {mins}m {secs}s\nBlocked Apps: {blocked_apps}\nAttempts: {attempts}"
+            f"App Blocker\nTime Remaining: {time_str}\nBlocked Apps: {blocked_apps}\nAttempts: {attempts}"
         )
 
+    def update_countdown(self):
+        start_epoch = self.blocker_thread.scheduled_start_epoch if self.blocker_thread else None
+        if start_epoch is None:
+            return
+        wait_seconds = int(start_epoch - time.time())
+        if wait_seconds <= 0:
+            # Blocking has started; the thread's update_stats signal takes over
+            self.countdown_timer.stop()
+            return
+        self.update_stats(wait_seconds, 0, self.blocker_thread.attempts)
+
     def blocking_finished(self):
         logging.info("Blocking session completed.")
         if self.blocker_thread and self.blocker_thread.notify:
             send_notification("App Blocker", "Finished blocking applications.")
 
+        self._reset_ui_to_idle()
+
+    def _reset_ui_to_idle(self):
+        # Batch the label and enable-state changes into a single repaint
+        self.setUpdatesEnabled(False)
+        self.countdown_timer.stop()
+
         # Reset Labels
+        self._last_stats = None
         self.time_label.setText("Time Remaining: N/A")
         self.apps_label.setText("Blocked Applications: 0")
         self.attempts_label.setText("Termination Attempts: 0")
@@ -427,6 +862,8 @@ class AppBlockerGUI(QtWidgets.QWidget):
         self.notify_checkbox.setEnabled(True)
         self.admin_checkbox.setEnabled(True)
 
+        self.setUpdatesEnabled(True)
+
     def closeEvent(self, event):
         event.ignore()
         self.hide()